@@ -1,7 +1,14 @@
 import streamlit as st
-from supabase import create_client
+import httpx
+from supabase import ClientOptions, create_client
 from datetime import datetime, timedelta
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from postgrest.exceptions import APIError
+import functools
 import hashlib
+import hmac
+import re
 
 
 # Mobile-friendly CSS
@@ -40,62 +47,112 @@ MOBILE_CSS = """
 </style>
 """
 
+# MOBILE_CSS without comments and indentation; this is what is sent to the browser
+MOBILE_CSS_MINIFIED = re.sub(r"\s+", " ", re.sub(r"/\*.*?\*/", "", MOBILE_CSS, flags=re.DOTALL)).strip()
+
+# How long session-cached habits/completions are reused before reloading
+USER_STATE_TTL = timedelta(minutes=5)
+
+# Argon2id hasher for user passwords (salted, memory-hard; OWASP-recommended 46 MiB, t=3, p=1)
+PASSWORD_HASHER = PasswordHasher(time_cost=3, memory_cost=46 * 1024, parallelism=1)
+
+
+def create_supabase_client(url):
+    """Create a Supabase client for the given API URL with a pooled HTTP client."""
+    # One keep-alive HTTP/2 pool shared by all sessions avoids a TCP/TLS handshake per query
+    # and multiplexes concurrent queries over a single connection
+    http_client = httpx.Client(
+        transport=httpx.HTTPTransport(
+            http2=True,
+            retries=2,  # Retry failed connection attempts
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=30)
+        ),
+        timeout=httpx.Timeout(10.0, connect=2.0)
+    )
+    return create_client(
+        url,
+        st.secrets["supabase"]["key"],
+        options=ClientOptions(httpx_client=http_client)
+    )
+
 
 @st.cache_resource
 def get_supabase_client():
     """Initialize Supabase client using Streamlit secrets."""
-    return create_client(
-        st.secrets["supabase"]["url"],
-        st.secrets["supabase"]["key"]
-    )
+    return create_supabase_client(st.secrets["supabase"]["url"])
 
 
-def hash_password(password):
-    """Hash password using SHA-256."""
-    return hashlib.sha256(password.encode()).hexdigest()
+@st.cache_resource
+def get_supabase_read_client():
+    """Initialize a read replica client, falling back to the primary if none is configured."""
+    read_url = st.secrets["supabase"].get("read_url")
+    if not read_url:
+        return get_supabase_client()
+    return create_supabase_client(read_url)
 
 
-def verify_access_code(supabase, code):
-    """Check if access code is valid and unused."""
-    response = supabase.table("access_codes").select("*").eq("code", code).eq("used", False).execute()
-    return len(response.data) > 0
+@st.cache_resource(show_spinner=False)
+def get_dummy_password_hash():
+    """Argon2 hash to verify against when a login fails without doing Argon2 work."""
+    return PASSWORD_HASHER.hash("not-a-real-password")
 
 
-def mark_access_code_used(supabase, code, username):
-    """Mark access code as used."""
-    supabase.table("access_codes").update({"used": True, "used_by": username}).eq("code", code).execute()
+def hash_password_legacy(password):
+    """Hash password using unsalted SHA-256, as stored for older accounts."""
+    return hashlib.sha256(password.encode()).hexdigest()
 
 
-def create_user(supabase, username, password):
-    """Create a new user."""
-    password_hash = hash_password(password)
+def create_user(supabase, username, password, access_code):
+    """Create a user, atomically claiming the access code; returns "ok", "taken", "invalid_code", "unreachable" or "error"."""
     try:
-        supabase.table("users").insert({
-            "username": username,
-            "password_hash": password_hash
+        response = supabase.rpc("sign_up", {
+            "u": username,
+            "p_hash": PASSWORD_HASHER.hash(password),
+            "access_code": access_code
         }).execute()
-        return True
-    except Exception:
-        return False
-
+    except APIError:
+        return "error"
+    except httpx.HTTPError:
+        # The signup may still have committed, so the caller shouldn't report a plain failure
+        return "unreachable"
+    if response.data not in ("ok", "taken", "invalid_code"):
+        return "error"
+    return response.data
 
-def verify_user(supabase, username, password):
-    """Verify user credentials."""
-    password_hash = hash_password(password)
-    response = supabase.table("users").select("*").eq("username", username).eq("password_hash", password_hash).execute()
-    return len(response.data) > 0
 
+def verify_dummy_password(password):
+    """Spend one Argon2 verification on a login that is failing anyway."""
+    try:
+        PASSWORD_HASHER.verify(get_dummy_password_hash(), password)
+    except VerificationError:
+        pass
 
-def user_exists(supabase, username):
-    """Check if username already exists."""
-    response = supabase.table("users").select("username").eq("username", username).execute()
-    return len(response.data) > 0
 
+def verify_user(supabase, username, password):
+    """Verify user credentials, rehashing legacy or outdated hashes on success."""
+    response = supabase.table("users").select("password_hash").eq("username", username).execute()
+    if not response.data:
+        # Do the same Argon2 work as for a wrong password so timing doesn't reveal unknown usernames
+        verify_dummy_password(password)
+        return False
 
-def load_habits(supabase, username):
-    """Load habits list from Supabase for a specific user."""
-    response = supabase.table("habits").select("*").eq("username", username).order("created_at").execute()
-    return response.data
+    stored_hash = response.data[0]["password_hash"]
+    if stored_hash.startswith("$argon2"):
+        try:
+            PASSWORD_HASHER.verify(stored_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+        needs_rehash = PASSWORD_HASHER.check_needs_rehash(stored_hash)
+    else:
+        if not hmac.compare_digest(stored_hash, hash_password_legacy(password)):
+            # Likewise, so accounts still on a legacy hash don't fail measurably faster
+            verify_dummy_password(password)
+            return False
+        needs_rehash = True
+
+    if needs_rehash:
+        supabase.table("users").update({"password_hash": PASSWORD_HASHER.hash(password)}).eq("username", username).execute()
+    return True
 
 
 def save_habit(supabase, username, habit_name, habit_type):
@@ -108,55 +165,89 @@ def save_habit(supabase, username, habit_name, habit_type):
 
 
 def remove_habit(supabase, username, habit_name):
-    """Remove a habit from Supabase."""
+    """Remove a habit from Supabase; its completions are deleted by ON DELETE CASCADE."""
     supabase.table("habits").delete().eq("name", habit_name).eq("username", username).execute()
-    supabase.table("completions").delete().eq("habit_name", habit_name).eq("username", username).execute()
 
 
-def load_completions(supabase, username):
-    """Load completions data from Supabase for a specific user."""
-    response = supabase.table("completions").select("*").eq("username", username).execute()
+# Shared across sessions per (username, today); the client arg is skipped when hashing
+@st.cache_data(ttl=60, show_spinner=False)
+def load_user_state(_supabase, username, today):
+    """Load habits (with streaks) and current-period completions in a single RPC round trip."""
+    response = _supabase.rpc("load_user_state", {"u": username, "today": today}).execute()
+    habits = response.data["habits"]
+    completions = {period_key: set(habit_names) for period_key, habit_names in response.data["completions"].items()}
+    return habits, completions
 
-    completions = {}
-    for row in response.data:
-        period_key = row["period_key"]
-        habit_name = row["habit_name"]
-        if period_key not in completions:
-            completions[period_key] = []
-        completions[period_key].append(habit_name)
 
-    return completions
+def get_user_state(read_supabase, username, now):
+    """Return habits and completions cached in the session, reloading when stale or from an earlier day."""
+    loaded_at = st.session_state.get("user_state_loaded_at")
+    # Streaks are computed for the load's day, so a new day needs fresh data even within the TTL
+    if loaded_at is None or now - loaded_at > USER_STATE_TTL or loaded_at.date() != now.date():
+        habits, completions = load_user_state(read_supabase, username, now.date().isoformat())
+        st.session_state["habits"] = habits
+        st.session_state["completions"] = completions
+        st.session_state["user_state_loaded_at"] = now
+    return st.session_state["habits"], st.session_state["completions"]
 
 
-def toggle_completion(supabase, username, period_key, habit_name, is_completed):
-    """Toggle completion status for a habit on a specific period."""
-    if is_completed:
-        supabase.table("completions").insert({
-            "period_key": period_key,
-            "habit_name": habit_name,
-            "username": username
-        }).execute()
-    else:
-        supabase.table("completions").delete().eq("period_key", period_key).eq("habit_name", habit_name).eq("username", username).execute()
+def clear_cached_user_state(username, now):
+    """Drop a user's shared load_user_state cache entry after they write."""
+    load_user_state.clear(None, username, now.date().isoformat())
+
+
+def invalidate_user_state(username, now):
+    """Drop the session and shared caches so the next run reloads from the database."""
+    st.session_state.pop("user_state_loaded_at", None)
+    clear_cached_user_state(username, now)
+
+
+def toggle_completions(supabase, username, period_key, added, removed):
+    """Mark habits done/undone for a period with one bulk insert and one bulk delete."""
+    if added:
+        # Upsert so one row already saved elsewhere (another tab/device) can't fail the whole batch
+        supabase.table("completions").upsert([
+            {"period_key": period_key, "habit_name": habit_name, "username": username}
+            for habit_name in added
+        ], on_conflict="period_key,habit_name,username", ignore_duplicates=True).execute()
+    if removed:
+        supabase.table("completions").delete().eq("period_key", period_key).eq("username", username).in_("habit_name", removed).execute()
 
 
 def get_period_key(habit_type, date=None):
     """Get the period key for a habit type."""
     if date is None:
         date = datetime.now()
+    return _period_key_for_day(habit_type, date.toordinal())
+
+
+@functools.lru_cache(maxsize=4096)
+def _period_key_for_day(habit_type, day_ordinal):
+    """Format the period key for a day; memoized, and built without strftime format parsing."""
+    date = datetime.fromordinal(day_ordinal).date()
 
     if habit_type == "daily":
-        return date.strftime("%Y-%m-%d")
+        return date.isoformat()
     elif habit_type == "weekly":
-        return date.strftime("%Y-W%W")
+        # ISO week, so the week around New Year has one key
+        year, week, _ = date.isocalendar()
+        return f"{year}-W{week:02d}"
     elif habit_type == "monthly":
-        return date.strftime("%Y-%m")
-    return date.strftime("%Y-%m-%d")
+        return f"{date.year}-{date.month:02d}"
+    return date.isoformat()
 
 
-def get_period_label(habit_type):
+def get_period_label(habit_type, now=None):
     """Get a human-readable label for the current period."""
-    now = datetime.now()
+    if now is None:
+        now = datetime.now()
+    return _period_label_for_day(habit_type, now.toordinal())
+
+
+@functools.lru_cache(maxsize=64)
+def _period_label_for_day(habit_type, day_ordinal):
+    """Format the period label for a day; memoized like _period_key_for_day."""
+    now = datetime.fromordinal(day_ordinal)
 
     if habit_type == "daily":
         return now.strftime("%a, %b %d")
@@ -169,34 +260,7 @@ def get_period_label(habit_type):
     return ""
 
 
-def get_streak(habit_name, habit_type, completions):
-    """Calculate current streak for a habit based on its type."""
-    streak = 0
-    check_date = datetime.now()
-
-    while True:
-        period_key = get_period_key(habit_type, check_date)
-
-        if period_key in completions and habit_name in completions[period_key]:
-            streak += 1
-            if habit_type == "daily":
-                check_date -= timedelta(days=1)
-            elif habit_type == "weekly":
-                check_date -= timedelta(weeks=1)
-            elif habit_type == "monthly":
-                if check_date.month == 1:
-                    check_date = check_date.replace(year=check_date.year - 1, month=12)
-                else:
-                    check_date = check_date.replace(month=check_date.month - 1)
-        else:
-            break
-
-        if streak > 365:
-            break
-
-    return streak
-
-
+@functools.lru_cache(maxsize=8)
 def get_streak_unit(habit_type, short=False):
     """Get the unit for streak display."""
     if short:
@@ -204,9 +268,15 @@ def get_streak_unit(habit_type, short=False):
     return {"daily": "day", "weekly": "week", "monthly": "month"}.get(habit_type, "day")
 
 
+def inject_css():
+    """Inject the minified mobile CSS."""
+    # Streamlit drops elements a rerun doesn't emit again, so this must run on every rerun
+    st.markdown(MOBILE_CSS_MINIFIED, unsafe_allow_html=True)
+
+
 def show_login_page(supabase):
     """Display login/signup page."""
-    st.markdown(MOBILE_CSS, unsafe_allow_html=True)
+    inject_css()
     st.title("📋 Habit Tracker")
 
     tab1, tab2 = st.tabs(["Login", "Sign Up"])
@@ -240,26 +310,28 @@ def show_login_page(supabase):
                 st.warning("Password must be at least 6 characters")
             elif signup_password != signup_password_confirm:
                 st.error("Passwords do not match")
-            elif user_exists(supabase, signup_username):
-                st.error("Username already taken")
-            elif not verify_access_code(supabase, access_code):
-                st.error("Invalid or already used access code")
             else:
-                if create_user(supabase, signup_username, signup_password):
-                    mark_access_code_used(supabase, access_code, signup_username)
+                result = create_user(supabase, signup_username, signup_password, access_code)
+                if result == "ok":
                     st.success("Account created! Please login.")
+                elif result == "taken":
+                    st.error("Username already taken")
+                elif result == "invalid_code":
+                    st.error("Invalid or already used access code")
+                elif result == "unreachable":
+                    st.error("Couldn't reach the server. Try logging in; if that fails, sign up again.")
                 else:
                     st.error("Failed to create account")
 
 
-def render_habit_card(supabase, username, habit, completions):
-    """Render a single habit as a mobile-friendly card."""
+def render_habit_card(habit, completions, period_key):
+    """Render a single habit as a mobile-friendly card and return its checkbox state."""
     habit_name = habit["name"]
     habit_type = habit.get("habit_type", "daily")
-    period_key = get_period_key(habit_type)
 
-    is_completed = habit_name in completions.get(period_key, [])
-    streak = get_streak(habit_name, habit_type, completions)
+    is_completed = habit_name in completions.get(period_key, ())
+    # prior_streak counts completed periods before this one and is computed by the database
+    streak = habit["prior_streak"] + 1 if is_completed else 0
     streak_unit = get_streak_unit(habit_type, short=True)
 
     # Use columns for compact layout: checkbox | name | streak
@@ -269,17 +341,11 @@ def render_habit_card(supabase, username, habit, completions):
         checkbox_value = st.checkbox(
             "Done",
             value=is_completed,
-            key=f"check_{habit_type}_{habit_name}",
+            # Keyed by period so a box ticked in an earlier period doesn't carry over
+            key=f"check_{period_key}_{habit_name}",
             label_visibility="collapsed"
         )
 
-        if checkbox_value != is_completed:
-            toggle_completion(supabase, username, period_key, habit_name, checkbox_value)
-            if checkbox_value:
-                completions.setdefault(period_key, []).append(habit_name)
-            else:
-                completions[period_key].remove(habit_name)
-
     with col2:
         if is_completed:
             st.markdown(f"~~{habit_name}~~")
@@ -292,23 +358,45 @@ def render_habit_card(supabase, username, habit, completions):
         else:
             st.markdown("")
 
+    return checkbox_value
 
-def render_habit_section(supabase, username, habits, completions, habit_type, icon, title):
-    """Render a section for a specific habit type."""
-    type_habits = [h for h in habits if h.get("habit_type", "daily") == habit_type]
 
+def render_habit_section(supabase, username, type_habits, completions, now, habit_type, icon, title):
+    """Render a section for a specific habit type."""
     if not type_habits:
         return False
 
-    period_label = get_period_label(habit_type)
+    period_label = get_period_label(habit_type, now)
+    period_key = get_period_key(habit_type, now)
 
     with st.expander(f"{icon} {title} ({period_label})", expanded=True):
-        for habit in type_habits:
-            render_habit_card(supabase, username, habit, completions)
+        # Checkboxes are batched in a form so N toggles cost one save, not N round trips
+        with st.form(f"form_{habit_type}"):
+            checked = {habit["name"]: render_habit_card(habit, completions, period_key) for habit in type_habits}
+            submitted = st.form_submit_button("Save", type="primary")
+
+        if submitted:
+            done = completions.setdefault(period_key, set())
+            added = [name for name, value in checked.items() if value and name not in done]
+            removed = [name for name, value in checked.items() if not value and name in done]
+            try:
+                toggle_completions(supabase, username, period_key, added, removed)
+            except APIError:
+                # The session cache can be stale, e.g. a habit removed on another device. A fragment
+                # rerun would reuse the stale arguments, so rerun the whole app to reload them.
+                invalidate_user_state(username, now)
+                st.session_state["dashboard_error"] = "Couldn't save; your habits changed on another device. Please try again."
+                st.rerun()
+            else:
+                clear_cached_user_state(username, now)
+                # Update the session-cached completions so the rerun needs no fetch
+                done.update(added)
+                done.difference_update(removed)
+                st.rerun(scope="fragment")
 
         # Compact progress
-        period_key = get_period_key(habit_type)
-        completed_count = sum(1 for h in type_habits if h["name"] in completions.get(period_key, []))
+        done = completions.get(period_key, set())
+        completed_count = sum(1 for h in type_habits if h["name"] in done)
         total_count = len(type_habits)
 
         st.progress(completed_count / total_count if total_count > 0 else 0)
@@ -317,7 +405,46 @@ def render_habit_section(supabase, username, habits, completions, habit_type, ic
     return True
 
 
-def show_main_app(supabase, username):
+@st.fragment
+def render_dashboard(supabase, username, habits, completions, now):
+    """Render the habit sections and overview; saving a section reruns only this fragment."""
+    # now is the time the data was loaded for, so keys match its streaks; fragment reruns reuse it
+    if datetime.now().date() != now.date():
+        # A new day (and maybe week or month) began since the load; reload before a save writes to the old period
+        st.session_state["dashboard_error"] = "A new day has started. Check your habits and save again."
+        st.rerun()
+
+    period_keys = {t: get_period_key(t, now) for t in ("daily", "weekly", "monthly")}
+
+    # Group habits by type in one pass for both the sections and the overview
+    habits_by_type = {t: [] for t in period_keys}
+    for habit in habits:
+        habits_by_type.setdefault(habit.get("habit_type", "daily"), []).append(habit)
+
+    # Render habit sections
+    has_daily = render_habit_section(supabase, username, habits_by_type["daily"], completions, now, "daily", "📅", "Daily")
+    has_weekly = render_habit_section(supabase, username, habits_by_type["weekly"], completions, now, "weekly", "📆", "Weekly")
+    has_monthly = render_habit_section(supabase, username, habits_by_type["monthly"], completions, now, "monthly", "🗓️", "Monthly")
+
+    # Compact overview stats
+    st.markdown("### 📊 Today")
+
+    # Only show non-empty categories
+    metrics = []
+    for habit_type, label in (("daily", "Daily"), ("weekly", "Weekly"), ("monthly", "Monthly")):
+        type_habits = habits_by_type[habit_type]
+        if type_habits:
+            done = completions.get(period_keys[habit_type], ())
+            done_count = sum(1 for h in type_habits if h["name"] in done)
+            metrics.append((label, f"{done_count}/{len(type_habits)}"))
+
+    if metrics:
+        cols = st.columns(len(metrics))
+        for i, (label, value) in enumerate(metrics):
+            cols[i].metric(label, value)
+
+
+def show_main_app(supabase, read_supabase, username):
     """Display the main habit tracker app."""
     st.set_page_config(
         page_title="Habit Tracker",
@@ -326,7 +453,7 @@ def show_main_app(supabase, username):
         initial_sidebar_state="collapsed"  # Start collapsed on mobile
     )
 
-    st.markdown(MOBILE_CSS, unsafe_allow_html=True)
+    inject_css()
 
     # Compact header
     col1, col2 = st.columns([5, 1])
@@ -337,9 +464,16 @@ def show_main_app(supabase, username):
             st.session_state.clear()
             st.rerun()
 
+    # One clock reading per run, shared by the load and the dashboard so both use the same periods
+    now = datetime.now()
+
     # Load user's data
-    habits = load_habits(supabase, username)
-    completions = load_completions(supabase, username)
+    habits, completions = get_user_state(read_supabase, username, now)
+
+    # Set by a dashboard save that had to reload the data
+    dashboard_error = st.session_state.pop("dashboard_error", None)
+    if dashboard_error:
+        st.error(dashboard_error)
 
     # Add habit section (inline, not sidebar for mobile)
     with st.expander("➕ Add Habit", expanded=False):
@@ -354,9 +488,20 @@ def show_main_app(supabase, username):
         if st.button("Add", type="primary", key="add_habit_btn"):
             existing_names = [h["name"] for h in habits]
             if new_habit and new_habit not in existing_names:
-                save_habit(supabase, username, new_habit, habit_type)
-                st.success(f"Added '{new_habit}'!")
-                st.rerun()
+                try:
+                    save_habit(supabase, username, new_habit, habit_type)
+                except APIError as e:
+                    # The session cache can miss a habit added on another device
+                    invalidate_user_state(username, now)
+                    if e.code == "23505":  # unique_violation
+                        st.warning("Already exists!")
+                    else:
+                        st.error("Couldn't add the habit. Please try again.")
+                else:
+                    clear_cached_user_state(username, now)
+                    # Update the session cache in place; the dashboard below renders it in this run
+                    habits.append({"name": new_habit, "habit_type": habit_type, "prior_streak": 0})
+                    st.success(f"Added '{new_habit}'!")
             elif new_habit in existing_names:
                 st.warning("Already exists!")
             else:
@@ -366,37 +511,7 @@ def show_main_app(supabase, username):
     if not habits:
         st.info("Add your first habit above!")
     else:
-        # Render habit sections
-        has_daily = render_habit_section(supabase, username, habits, completions, "daily", "📅", "Daily")
-        has_weekly = render_habit_section(supabase, username, habits, completions, "weekly", "📆", "Weekly")
-        has_monthly = render_habit_section(supabase, username, habits, completions, "monthly", "🗓️", "Monthly")
-
-        # Compact overview stats
-        st.markdown("### 📊 Today")
-
-        daily_habits = [h for h in habits if h.get("habit_type", "daily") == "daily"]
-        weekly_habits = [h for h in habits if h.get("habit_type") == "weekly"]
-        monthly_habits = [h for h in habits if h.get("habit_type") == "monthly"]
-
-        # Only show non-empty categories
-        metrics = []
-        if daily_habits:
-            daily_key = get_period_key("daily")
-            daily_done = sum(1 for h in daily_habits if h["name"] in completions.get(daily_key, []))
-            metrics.append(("Daily", f"{daily_done}/{len(daily_habits)}"))
-        if weekly_habits:
-            weekly_key = get_period_key("weekly")
-            weekly_done = sum(1 for h in weekly_habits if h["name"] in completions.get(weekly_key, []))
-            metrics.append(("Weekly", f"{weekly_done}/{len(weekly_habits)}"))
-        if monthly_habits:
-            monthly_key = get_period_key("monthly")
-            monthly_done = sum(1 for h in monthly_habits if h["name"] in completions.get(monthly_key, []))
-            metrics.append(("Monthly", f"{monthly_done}/{len(monthly_habits)}"))
-
-        if metrics:
-            cols = st.columns(len(metrics))
-            for i, (label, value) in enumerate(metrics):
-                cols[i].metric(label, value)
+        render_dashboard(supabase, username, habits, completions, now)
 
         # Remove habit (collapsible)
         with st.expander("🗑️ Remove Habit", expanded=False):
@@ -404,7 +519,12 @@ def show_main_app(supabase, username):
             habit_to_remove = st.selectbox("Select", habit_names, key="remove_select")
             if st.button("Remove", type="secondary", key="remove_btn"):
                 remove_habit(supabase, username, habit_to_remove)
+                clear_cached_user_state(username, now)
+                habits[:] = [h for h in habits if h["name"] != habit_to_remove]
+                for done in completions.values():
+                    done.discard(habit_to_remove)
                 st.success(f"Removed!")
+                # The dashboard above was drawn before the removal; rerun (no fetch) to redraw it
                 st.rerun()
 
 
@@ -414,6 +534,7 @@ def main():
 
     try:
         supabase = get_supabase_client()
+        read_supabase = get_supabase_read_client()
     except Exception as e:
         st.error("Failed to connect to Supabase.")
         st.code(str(e))
@@ -423,7 +544,7 @@ def main():
         st.set_page_config(page_title="Habit Tracker", page_icon="✅", layout="centered")
         show_login_page(supabase)
     else:
-        show_main_app(supabase, st.session_state["username"])
+        show_main_app(supabase, read_supabase, st.session_state["username"])
 
 
 if __name__ == "__main__":